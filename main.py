@@ -1,14 +1,58 @@
+from __future__ import annotations
+
 from typing import Tuple
 from typing import Optional
+from typing import TYPE_CHECKING
+import math
 
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
-from matplotlib import pyplot as plot
-from matplotlib import patches as patches
-from matplotlib import figure as fig
-from matplotlib import axes as ax
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import numpy as np
+
+# Matplotlib takes a noticeable time to import, so at runtime it is only bound by load_matplotlib once a layout is drawn
+if TYPE_CHECKING:
+	from matplotlib import axes as ax
+	from matplotlib import pyplot as plot
+	from matplotlib import patches as patches
+	from matplotlib import collections as collections
+	from matplotlib import transforms as transforms
+	from matplotlib import figure as fig
+	from matplotlib.textpath import TextPath
+	from matplotlib.path import Path
+	from matplotlib.backends.backend_agg import FigureCanvasAgg
+	from PIL import Image
+	from PIL import ImageTk
+else:
+	plot = None
+	patches = None
+	collections = None
+	transforms = None
+	fig = None
+	TextPath = None
+	Path = None
+	FigureCanvasAgg = None
+	Image = None
+	ImageTk = None
+
+
+def load_matplotlib() -> None:
+	"""
+	Imports the Matplotlib and Pillow modules used for drawing on first use, keeping them out of the application startup.
+	"""
+	global plot, patches, collections, transforms, fig, TextPath, Path, FigureCanvasAgg, Image, ImageTk
+	if plot is not None:
+		return
+	from matplotlib import pyplot as plot
+	from matplotlib import patches as patches
+	from matplotlib import collections as collections
+	from matplotlib import transforms as transforms
+	from matplotlib import figure as fig
+	from matplotlib.textpath import TextPath
+	from matplotlib.path import Path
+	from matplotlib.backends.backend_agg import FigureCanvasAgg
+	from PIL import Image
+	from PIL import ImageTk
 
 
 class Memory:
@@ -30,33 +74,62 @@ class Memory:
 		DECODER_HEIGHT (float): The height of the decoder.
 		DECODER_CONNECT_OFFSET (float): The offset for connecting the decoder.
 		DATABUS_OFFSET (float): The offset for the data bus.
+		MAR_EDGE (float): The X position of the outer edge of a chip's MAR, relative to the chip.
+		ADDRESS_BUS_X (float): The X position of the vertical address bus.
+		ADDRESS_SPLIT_X (float): The X position, relative to a chip, where its address line branches off.
 
 	Methods:
-		__init__(self, memory_capacity: int, memory_wordsize: int, chip_capacity: int, chip_wordsize: int):
+		__init__(self, memory_capacity: int, memory_wordsize: int, chip_capacity: int, chip_wordsize: int, axis: Optional[ax.Axes] = None):
 			Initializes the memory system with the given parameters and sets up the memory dimensions.
 		
 		setmemory(self) -> None:
-			Sets up the memory configuration, calculating the number of rows and columns of chips, 
-			and configuring the plot for visualization.
+			Sets up the figure and axis, or clears the given axis, configuring the plot for visualization.
 		
-		calculate_dimensions(self) -> Tuple[int, int]:
-			Calculates the number of chips in each row and column based on memory and chip capacities.
+		calculate_dimensions(memory_capacity: int, memory_wordsize: int, chip_capacity: int, chip_wordsize: int) -> Tuple[int, int]:
+			Validates the parameters and calculates the number of chips in each row and column based on memory and chip capacities.
 		
+		build_chip_origins(self) -> np.ndarray:
+			Computes the origin of every chip.
+
 		draw_chips(self) -> None:
 			Draws the individual memory chips in the visualization.
-		
+
+		make_segments(*parts: Tuple) -> np.ndarray:
+			Builds one preallocated array of line segments from groups of broadcastable start and end coordinates.
+
+		add_shapes(self, paths: list, offsets: np.ndarray, **kwargs) -> None:
+			Adds copies of shared shapes to the visualization as a single collection.
+
+		add_lines(self, segments: np.ndarray, colors, linewidths) -> None:
+			Adds a batch of line segments to the visualization as a single collection.
+
+		build_addressing_unit_segments(self) -> Tuple[np.ndarray, np.ndarray]:
+			Computes the connection lines and MAR positions of every chip's addressing unit.
+
 		draw_addressing_unit(self) -> None:
 			Draws the addressing unit (MAR) for each chip in the visualization.
 		
+		build_RW_segments(self) -> np.ndarray:
+			Computes the Read/Write line segments.
+
 		draw_RW(self) -> None:
 			Draws the Read/Write lines for the memory system.
 		
+		build_decoder_segments(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+			Computes the decoder outline, select line segments and junction dots as NumPy arrays.
+		
 		draw_decoder(self) -> None:
 			Draws the decoder, responsible for addressing and selecting the appropriate chips.
 		
+		build_address_lines_segments(self) -> np.ndarray:
+			Computes the address line segments.
+
 		draw_address_lines(self) -> None:
 			Draws the address lines connecting the decoder to the chips.
 		
+		build_data_lines_segments(self) -> Tuple[np.ndarray, np.ndarray]:
+			Computes the data bus segments and the points where the chips connect to them.
+
 		draw_data_lines(self) -> None:
 			Draws the data lines that connect the memory chips.
 	"""
@@ -72,12 +145,16 @@ class Memory:
 	DECODER_HEIGHT = 2
 	DECODER_CONNECT_OFFSET = 0.6
 	DATABUS_OFFSET = 0.25
+	MAR_EDGE = -CHIP_DECODER_WIDTH - MAR_WIDTH
+	ADDRESS_BUS_X = DECODER_POS / 2
+	ADDRESS_SPLIT_X = (ADDRESS_BUS_X + MAR_EDGE) / 2
 	def __init__(
 		self, 
 		memory_capacity: int, 
 		memory_wordsize: int,
 		chip_capacity: int,
 		chip_wordsize: int,
+		axis: Optional[ax.Axes] = None,
 	):
 		"""
 		Initializes the memory system with the given parameters.
@@ -87,166 +164,378 @@ class Memory:
 			memory_wordsize (int): The word size of the memory (in bytes).
 			chip_capacity (int): The capacity of a single chip (in bytes).
 			chip_wordsize (int): The word size of a single chip (in bytes).
+			axis (Optional[ax.Axes]): An existing axis to draw the layout on. It is cleared before use.
+				A new figure and axis are created when it is not given.
 		"""
 		self.memory_capacity: int = memory_capacity
 		self.memory_wordsize: int = memory_wordsize
 		self.chip_capacity: int = chip_capacity
 		self.chip_wordsize: int = chip_wordsize
-		self.rows: Optional[int] = None
-		self.columns: Optional[int] = None
-		self.figure: Optional[fig.Figure] = None
-		self.axis: Optional[ax.Axes] = None
+		self.rows, self.columns = self.calculate_dimensions(memory_capacity, memory_wordsize, chip_capacity, chip_wordsize)
+		self.figure: Optional[fig.Figure] = axis.figure if axis is not None else None
+		self.axis: Optional[ax.Axes] = axis
 		self.setmemory()
+		self._col_x: np.ndarray = np.arange(self.columns) * self.CHIP_SPACING
+		self._row_y: np.ndarray = np.arange(self.rows) * self.CHIP_SPACING
 
 
 	def setmemory(self) -> None:
 		"""
-		Calculates the number of rows and columns needed for memory chips and sets up the plot.
+		Sets up the plot the memory layout is drawn on, reusing the given axis if there is one.
 		"""
-		P, Q = self.calculate_dimensions
-		self.rows = P
-		self.columns = Q
-		self.figure, self.axis = plot.subplots(constrained_layout = True, figsize = (15, 15))
+		load_matplotlib()
+		if self.axis is None:
+			self.figure, self.axis = plot.subplots(constrained_layout = True, figsize = (15, 15))
+		else:
+			self.axis.clear()
 		for spine in self.axis.spines.values():
 			spine.set_visible(False)
 		self.axis.set_xticks([])
 		self.axis.set_yticks([])
 		self.axis.set_aspect('equal')
+		# The extent of the layout is known from its dimensions, so fix the limits instead of autoscaling on every artist
+		self.axis.set_xlim(self.DECODER_POS - 1, self.columns * self.CHIP_SPACING + 2)
+		self.axis.set_ylim(-self.CHIP_SPACING, self.rows * self.CHIP_SPACING + 1)
+		self.axis.set_autoscale_on(False)
 	
 
-	@property
-	def calculate_dimensions(self) -> Tuple[int, int]:
+	@staticmethod
+	def calculate_dimensions(memory_capacity: int, memory_wordsize: int, chip_capacity: int, chip_wordsize: int) -> Tuple[int, int]:
 		"""
 		Calculates the number of chips in each row and column based on memory and chip parameters.
+		It needs no figure, so parameters can be validated before anything is drawn.
+
+		Args:
+			memory_capacity (int): The total capacity of the memory system (in bytes).
+			memory_wordsize (int): The word size of the memory (in bytes).
+			chip_capacity (int): The capacity of a single chip (in bytes).
+			chip_wordsize (int): The word size of a single chip (in bytes).
 
 		Returns:
 			Tuple[int, int]: A tuple containing the number of rows and columns.
 		
 		Raises:
-			ValueError: If any of the parameters (memory_capacity, memory_wordsize, chip_capacity, chip_wordsize) is zero or less.
+			ValueError: If any of the parameters (memory_capacity, memory_wordsize, chip_capacity, chip_wordsize) is zero or less,
+				or if the memory capacity and word size are not whole multiples of the chip capacity and word size.
 		"""
-		if (self.memory_capacity == 0 or self.memory_wordsize == 0 or self.chip_capacity == 0 or self.chip_wordsize == 0):
+		if (memory_capacity == 0 or memory_wordsize == 0 or chip_capacity == 0 or chip_wordsize == 0):
 			raise ValueError("All values must be greater than zero")
-		P = self.memory_capacity // self.chip_capacity
-		Q = self.memory_wordsize // self.chip_wordsize
+		P = memory_capacity // chip_capacity
+		Q = memory_wordsize // chip_wordsize
 		if P <= 0 or Q <= 0:
 			raise ValueError("Memory must be greater than or equal to chip")
+		if memory_capacity % chip_capacity or memory_wordsize % chip_wordsize:
+			raise ValueError("Memory capacity and word size must be multiples of the chip capacity and word size")
 		return (P, Q)
 
 
+	def build_chip_origins(self) -> np.ndarray:
+		"""
+		Computes the bottom-left corner of every chip without touching the plot.
+
+		Returns:
+			np.ndarray: An array of shape (rows * columns, 2) holding the (x, y) origin of each chip.
+		"""
+		X, Y = np.meshgrid(self._col_x, self._row_y)
+		return np.column_stack([X.ravel(), Y.ravel()])
+
+
 	def draw_chips(self) -> None:
 		"""
 		Draws the individual memory chips in the plot. Each chip is represented as a rectangle with a label "CS".
 		"""
 		CS_offset = (9, -5)
-		for col in range(self.columns):
-			for row in range(self.rows):
-				rectangle = patches.Rectangle((col * self.CHIP_SPACING, row * self.CHIP_SPACING), self.CHIP_WIDTH, self.CHIP_HEIGHT, edgecolor = 'black', facecolor = '#47c295', linewidth = 2)
-				self.axis.add_patch(rectangle)
-				self.axis.annotate("CS", (col * self.CHIP_SPACING + 1, row * self.CHIP_SPACING + 1.5), textcoords = 'offset points', xytext = CS_offset)
+		origins = self.build_chip_origins()
+		chip = Path.unit_rectangle().transformed(transforms.Affine2D().scale(self.CHIP_WIDTH, self.CHIP_HEIGHT))
+		self.add_shapes([chip], origins, edgecolor = 'black', facecolor = '#47c295', linewidth = 2)
+		# A single "CS" glyph path, offset in points from each chip's corner, is shared by every label
+		# Like annotations, the labels are not clipped, as the last column's may extend past the axis limits
+		label = TextPath(CS_offset, "CS")
+		points_to_pixels = transforms.Affine2D().scale(1 / 72) + self.figure.dpi_scale_trans
+		labels = collections.PathCollection([label], offsets = origins + (1, 1.5), offset_transform = self.axis.transData, transform = points_to_pixels, facecolor = 'black', linewidth = 0, zorder = 3, clip_on = False)
+		self.axis.add_collection(labels, autolim = False)
 				
 
+	@staticmethod
+	def make_segments(*parts: Tuple) -> np.ndarray:
+		"""
+		Builds line segments from groups of start and end coordinates.
+		The output array is allocated once at its final size and every group is written into its slice in place.
+
+		Args:
+			*parts (Tuple): Groups of (x0, y0, x1, y1) coordinates. Each coordinate is a scalar or an array,
+				broadcast against the other coordinates of its group.
+
+		Returns:
+			np.ndarray: An array of shape (N, 2, 2) holding one ((x0, y0), (x1, y1)) pair per segment.
+		"""
+		shapes = [np.broadcast_shapes(*(np.shape(coordinate) for coordinate in part)) for part in parts]
+		sizes = [math.prod(shape) for shape in shapes]
+		segments = np.empty((sum(sizes), 2, 2))
+		start = 0
+		for (x0, y0, x1, y1), shape, size in zip(parts, shapes, sizes):
+			group = segments[start:start + size].reshape(shape + (2, 2))
+			group[..., 0, 0] = x0
+			group[..., 0, 1] = y0
+			group[..., 1, 0] = x1
+			group[..., 1, 1] = y1
+			start += size
+		return segments
+
+
+	def add_shapes(self, paths: list, offsets: np.ndarray, **kwargs) -> None:
+		"""
+		Adds copies of shared shapes to the plot as a single PathCollection.
+		Only the shapes' paths are stored once, each copy is just an offset.
+
+		Args:
+			paths (list): The shapes, as paths in data units relative to their own origin. They are cycled through the offsets.
+			offsets (np.ndarray): The (x, y) data coordinates to place each copy at, as an array of shape (N, 2).
+			**kwargs: Style properties passed on to the PathCollection.
+		"""
+		# Only the scaling of transData applies to the paths themselves, the translation comes from the offsets
+		shapes = collections.PathCollection(paths, offsets = offsets, offset_transform = self.axis.transData, transform = transforms.AffineDeltaTransform(self.axis.transData), joinstyle = 'miter', **kwargs)
+		self.axis.add_collection(shapes, autolim = False)
+
+
+	def add_lines(self, segments: np.ndarray, colors = 'black', linewidths = 1.5) -> None:
+		"""
+		Adds a batch of line segments to the plot as a single LineCollection.
+
+		Args:
+			segments (np.ndarray): The segments to draw, as an array of shape (N, 2, 2).
+			colors: A single color or one color per segment.
+			linewidths: A single line width or one line width per segment.
+		"""
+		lines = collections.LineCollection(segments, colors = colors, linewidths = linewidths, capstyle = 'projecting')
+		self.axis.add_collection(lines, autolim = False)
+
+
+	def build_addressing_unit_segments(self) -> Tuple[np.ndarray, np.ndarray]:
+		"""
+		Computes the geometry of every chip's addressing unit without touching the plot.
+
+		Returns:
+			Tuple[np.ndarray, np.ndarray]: The connection line segments, and the (x, y) origin of each MAR.
+		"""
+		X, Y = np.meshgrid(self._col_x, self._row_y)
+		x_start = X - self.CHIP_DECODER_WIDTH
+		chip_top = Y + self.CHIP_HEIGHT
+		y_bottom = Y + self.CHIP_DECODER_WIDTH
+		y_top = chip_top - self.CHIP_DECODER_WIDTH
+		segments = self.make_segments(
+			(x_start, y_bottom, X, Y),
+			(x_start, y_top, X, chip_top),
+			(x_start, y_bottom, x_start, y_top),
+		)
+		return (segments, np.column_stack([x_start.ravel(), y_bottom.ravel()]))
+
+
 	def draw_addressing_unit(self) -> None:
 		"""
 		Draws the addressing unit (MAR) for each chip. This includes the Memory Address Register and its connection lines.
 		"""
-		for row in range(self.rows):
-			for col in range(self.columns):
-				x_start = col * self.CHIP_SPACING - self.CHIP_DECODER_WIDTH
-				x_end = col * self.CHIP_SPACING
-				chip_bottom = row * self.CHIP_SPACING
-				chip_top = row * self.CHIP_SPACING + self.CHIP_HEIGHT
-				y_bottom = chip_bottom + self.CHIP_DECODER_WIDTH
-				y_top = chip_top - self.CHIP_DECODER_WIDTH
-				self.axis.plot([x_start, x_end], [y_bottom, chip_bottom], color = 'black', linewidth = 2)
-				self.axis.plot([x_start, x_end], [y_top, chip_top], color = 'black', linewidth = 2)
-				self.axis.plot([x_start, x_start], [y_bottom, y_top], color = 'black', linewidth = 2)
-				MAR = patches.Rectangle((x_start, y_bottom), -self.MAR_WIDTH, y_top - y_bottom, edgecolor = 'black', facecolor = 'brown', linewidth = 2)
-				self.axis.add_patch(MAR)
+		segments, MAR_origins = self.build_addressing_unit_segments()
+		MAR = Path.unit_rectangle().transformed(transforms.Affine2D().scale(-self.MAR_WIDTH, self.CHIP_HEIGHT - 2 * self.CHIP_DECODER_WIDTH))
+		self.add_shapes([MAR], MAR_origins, edgecolor = 'black', facecolor = 'brown', linewidth = 2)
+		self.add_lines(segments, linewidths = 2)
 
 
-	def draw_RW(self) -> None:
+	def build_RW_segments(self) -> np.ndarray:
 		"""
-		Draws the Read/Write lines connecting the chips to the R/W unit.
+		Computes the Read/Write line segments without touching the plot.
+
+		Returns:
+			np.ndarray: The R/W line segments. The first one is the main R/W line, running up to where it is labelled.
 		"""
 		x_pos = [self.RW_X_POS, self.RW_X_POS]
 		y_pos = [self.RW_Y_POS, self.rows * self.CHIP_SPACING if self.rows != 1 else self.RW_Y_POS]
+		X, Y = np.meshgrid(self._col_x + self.RW_CONNECT_OFFSET, self._row_y)
+		return self.make_segments(
+			(x_pos[0], y_pos[0], x_pos[1], y_pos[1]),
+			(self.RW_X_POS, Y + self.RW_Y_POS, X, Y + self.RW_Y_POS),
+			(X, Y + self.RW_Y_POS, X, Y + self.CHIP_HEIGHT),
+		)
+
+
+	def draw_RW(self) -> None:
+		"""
+		Draws the Read/Write lines connecting the chips to the R/W unit.
+		"""
 		text_offset = (6, -15)
-		self.axis.plot(x_pos, y_pos, color = 'red')
-		self.axis.annotate("R/W", (x_pos[1], y_pos[1]), textcoords = 'offset points', xytext = text_offset, weight = 'extra bold', fontsize = 10)
-		for col in range(self.columns):
-			for row in range(self.rows):
-				self.axis.plot([self.RW_X_POS, col * self.CHIP_SPACING + self.RW_CONNECT_OFFSET], [row * self.CHIP_SPACING + self.RW_Y_POS, row * self.CHIP_SPACING + self.RW_Y_POS], color = 'red')
-				self.axis.plot([col * self.CHIP_SPACING + self.RW_CONNECT_OFFSET, col * self.CHIP_SPACING + self.RW_CONNECT_OFFSET], [row * self.CHIP_SPACING + self.RW_Y_POS, row * self.CHIP_SPACING + self.CHIP_HEIGHT], color = 'red')
+		segments = self.build_RW_segments()
+		self.axis.annotate("R/W", tuple(segments[0, 1]), textcoords = 'offset points', xytext = text_offset, weight = 'extra bold', fontsize = 10)
+		self.add_lines(segments, colors = 'red')
 
 
-	def draw_decoder(self) -> None:
+	def build_decoder_segments(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
 		"""
-		Draws the decoder, which is responsible for chip addressing and selection.
+		Computes the geometry of the decoder and its select lines without touching the plot.
+
+		Returns:
+			Tuple[np.ndarray, np.ndarray, np.ndarray]: The decoder outline segments, the select line segments,
+			and the (x, y) positions of the junction dots.
 		"""
 		x_end = self.DECODER_POS - 0.3
 		decoder_bottom = ((self.rows * self.CHIP_SPACING) / 2) - self.DECODER_HEIGHT
 		decoder_top = self.rows * self.CHIP_SPACING / 2
 		decoder_bottom_l = decoder_bottom + 0.25
 		decoder_top_l = decoder_top - 0.25
-		if self.rows > 1:
-			self.axis.plot([self.DECODER_POS, self.DECODER_POS], [decoder_bottom, decoder_top], color = 'black')
-			self.axis.plot([x_end, x_end], [decoder_bottom_l, decoder_top_l], color = 'black')
-			self.axis.plot([x_end, self.DECODER_POS], [decoder_bottom_l, decoder_bottom], color = 'black')
-			self.axis.plot([x_end, self.DECODER_POS], [decoder_top_l, decoder_top], color = 'black')
-			self.axis.plot([x_end - 0.5, x_end], [decoder_bottom_l + (decoder_top_l - decoder_bottom_l) / 2, decoder_bottom_l + (decoder_top_l - decoder_bottom_l) / 2], color = 'black', lw = 1.75)
 		lines_space = (decoder_top - decoder_bottom) / (self.rows + 1)
-		n = 0
-		m = self.rows
-		chip_y_pos = [i * self.CHIP_SPACING + self.CHIP_HEIGHT + 0.5 for i in range(self.rows)]
-		while n < m:
-			decoder_bottom += lines_space
-			decoder_top -= lines_space
-			n += 1
-			m -= 1
-			line_length = self.DECODER_POS + 0.2 * n
-			if self.rows > 1:
-				self.axis.plot(self.DECODER_POS, decoder_bottom, 'ko', ms = 7.5) 
-				self.axis.plot(self.DECODER_POS, decoder_top, 'ko', ms = 7.5) 
-				self.axis.plot([self.DECODER_POS, line_length], [decoder_bottom, decoder_bottom], color = 'black', lw = 1.75)
-				self.axis.plot([self.DECODER_POS, line_length], [decoder_top, decoder_top], color = 'black', lw = 1.75)
-				self.axis.plot([line_length, line_length], [decoder_bottom, chip_y_pos[n - 1]], color = 'black', lw = 1.75)
-				self.axis.plot([line_length, line_length], [decoder_top, chip_y_pos[m]], color = 'black', lw = 1.75)
-			self.axis.plot([line_length, (self.columns - 1) * self.CHIP_SPACING + self.DECODER_CONNECT_OFFSET], [chip_y_pos[n - 1], chip_y_pos[n - 1]], color = 'black', lw = 1.75)
-			self.axis.plot([line_length, (self.columns - 1) * self.CHIP_SPACING + self.DECODER_CONNECT_OFFSET], [chip_y_pos[m], chip_y_pos[m]], color = 'black', lw = 1.75)
-			for col in range(self.columns):
-				self.axis.plot([col * self.CHIP_SPACING + self.DECODER_CONNECT_OFFSET, col * self.CHIP_SPACING + self.DECODER_CONNECT_OFFSET], [chip_y_pos[n - 1], chip_y_pos[n - 1] - 0.5], color = 'black', lw = 1.75)
-				self.axis.plot([col * self.CHIP_SPACING + self.DECODER_CONNECT_OFFSET, col * self.CHIP_SPACING + self.DECODER_CONNECT_OFFSET], [chip_y_pos[m], chip_y_pos[m] - 0.5], color = 'black', lw = 1.75)
-				self.axis.plot(col * self.CHIP_SPACING + self.DECODER_CONNECT_OFFSET, chip_y_pos[n - 1] - 0.5, 'ko', ms = 7.5) 
-				self.axis.plot(col * self.CHIP_SPACING + self.DECODER_CONNECT_OFFSET, chip_y_pos[m] - 0.5, 'ko', ms = 7.5) 
+		chip_y_pos = self._row_y + self.CHIP_HEIGHT + 0.5
+		last_x = self._col_x[-1] + self.DECODER_CONNECT_OFFSET
+		# Each select line pairs the n-th row from the bottom with the n-th row from the top.
+		# With an odd number of rows the middle row pairs with itself, so it only gets the lower line.
+		n = np.arange(1, (self.rows + 1) // 2 + 1)
+		line_length = self.DECODER_POS + 0.2 * n
+		upper_length = line_length[:self.rows // 2]
+		lower_y = chip_y_pos[n - 1]
+		upper_y = chip_y_pos[self.rows - n[:self.rows // 2]]
+		X, Y = np.meshgrid(self._col_x + self.DECODER_CONNECT_OFFSET, chip_y_pos)
+		parts = [
+			(line_length, lower_y, last_x, lower_y),
+			(upper_length, upper_y, last_x, upper_y),
+			(X, Y, X, Y - 0.5),
+		]
+		outline = []
+		dots = []
+		if self.rows > 1:
+			middle = decoder_bottom_l + (decoder_top_l - decoder_bottom_l) / 2
+			outline = [
+				(self.DECODER_POS, decoder_bottom, self.DECODER_POS, decoder_top),
+				(x_end, decoder_bottom_l, x_end, decoder_top_l),
+				(x_end, decoder_bottom_l, self.DECODER_POS, decoder_bottom),
+				(x_end, decoder_top_l, self.DECODER_POS, decoder_top),
+			]
+			outputs_bottom = decoder_bottom + n * lines_space
+			outputs_top = decoder_top - n[:self.rows // 2] * lines_space
+			parts += [
+				(x_end - 0.5, middle, x_end, middle),
+				(self.DECODER_POS, outputs_bottom, line_length, outputs_bottom),
+				(self.DECODER_POS, outputs_top, upper_length, outputs_top),
+				(line_length, outputs_bottom, line_length, lower_y),
+				(upper_length, outputs_top, upper_length, upper_y),
+			]
+			dots += [
+				np.column_stack(np.broadcast_arrays(self.DECODER_POS, outputs_bottom)),
+				np.column_stack(np.broadcast_arrays(self.DECODER_POS, outputs_top)),
+			]
+		dots.append(np.column_stack([X.ravel(), Y.ravel() - 0.5]))
+		return (self.make_segments(*outline), self.make_segments(*parts), np.concatenate(dots))
+
+
+	def draw_decoder(self) -> None:
+		"""
+		Draws the decoder, which is responsible for chip addressing and selection.
+		"""
+		outline, segments, dots = self.build_decoder_segments()
+		self.add_lines(np.concatenate([outline, segments]), linewidths = [1.5] * len(outline) + [1.75] * len(segments))
+		self.axis.plot(dots[:, 0], dots[:, 1], 'ko', ms = 7.5, scalex = False, scaley = False)
+
+
+	def build_address_lines_segments(self) -> np.ndarray:
+		"""
+		Computes the address line segments without touching the plot.
+
+		Returns:
+			np.ndarray: The address line segments. The first two are the main address buses.
+		"""
+		row_y = self._row_y + self.CHIP_HEIGHT / 2
+		# The first two parts are the main address buses, drawn slightly thicker than the per-chip lines
+		parts = [
+			(self.DECODER_POS - 0.3, self.CHIP_HEIGHT / 2, self.MAR_EDGE, self.CHIP_HEIGHT / 2),
+			(self.ADDRESS_BUS_X, self.CHIP_HEIGHT / 2, self.ADDRESS_BUS_X, row_y[-1]),
+			(self.ADDRESS_BUS_X, row_y, self.MAR_EDGE, row_y),
+		]
+		if self.columns > 1:
+			split_x = self._col_x + self.ADDRESS_SPLIT_X
+			branch_y = self._row_y - 0.5
+			parts += [
+				(split_x[0], branch_y, split_x[-1], branch_y),
+				(split_x, row_y[:, np.newaxis], split_x, branch_y[:, np.newaxis]),
+				(split_x, row_y[:, np.newaxis], self._col_x + self.MAR_EDGE, row_y[:, np.newaxis]),
+			]
+		return self.make_segments(*parts)
 
 
 	def draw_address_lines(self) -> None:
 		"""
 		Draws the address lines that connect the decoder to each memory chip.
 		"""
-		self.axis.plot([self.DECODER_POS - 0.3, -self.CHIP_DECODER_WIDTH - self.MAR_WIDTH], [self.CHIP_HEIGHT / 2, self.CHIP_HEIGHT / 2], color = 'black', lw = 1.75)
-		self.axis.plot([self.DECODER_POS / 2, self.DECODER_POS / 2], [self.CHIP_HEIGHT / 2, ((self.rows - 1) * self.CHIP_SPACING + self.CHIP_HEIGHT / 2) if self.rows != 1 else self.CHIP_HEIGHT / 2], color = 'black', lw = 1.75)
-		for row in range(self.rows):
-			self.axis.plot([self.DECODER_POS / 2, -self.CHIP_DECODER_WIDTH - self.MAR_WIDTH], [row * self.CHIP_SPACING + self.CHIP_HEIGHT / 2, row * self.CHIP_SPACING + self.CHIP_HEIGHT / 2], color = 'black')
-			if self.columns > 1:
-				self.axis.plot([(self.DECODER_POS / 2 + (-self.CHIP_DECODER_WIDTH - self.MAR_WIDTH)) / 2, (self.columns - 1) * self.CHIP_SPACING + (self.DECODER_POS / 2 + (-self.CHIP_DECODER_WIDTH - self.MAR_WIDTH)) / 2], [row * self.CHIP_SPACING + self.CHIP_HEIGHT / 2 - (self.CHIP_HEIGHT / 2 + 0.5), row * self.CHIP_SPACING + self.CHIP_HEIGHT / 2 - (self.CHIP_HEIGHT / 2 + 0.5)], color = 'black')
-				for col in range(self.columns):
-					self.axis.plot([col * self.CHIP_SPACING + (self.DECODER_POS / 2 + (-self.CHIP_DECODER_WIDTH - self.MAR_WIDTH)) / 2, col * self.CHIP_SPACING + (self.DECODER_POS / 2 + (-self.CHIP_DECODER_WIDTH - self.MAR_WIDTH)) / 2], [row * self.CHIP_SPACING + self.CHIP_HEIGHT / 2, row * self.CHIP_SPACING + self.CHIP_HEIGHT / 2 - (self.CHIP_HEIGHT / 2 + 0.5)], color = 'black')
-					self.axis.plot([col * self.CHIP_SPACING + (self.DECODER_POS / 2 + (-self.CHIP_DECODER_WIDTH - self.MAR_WIDTH)) / 2, col * self.CHIP_SPACING -self.CHIP_DECODER_WIDTH -self.MAR_WIDTH], [row * self.CHIP_SPACING + self.CHIP_HEIGHT / 2, row * self.CHIP_SPACING + self.CHIP_HEIGHT / 2], color = 'black')
+		segments = self.build_address_lines_segments()
+		linewidths = np.full(len(segments), 1.5)
+		linewidths[:2] = 1.75
+		self.add_lines(segments, linewidths = linewidths)
 					
 
+	def build_data_lines_segments(self) -> Tuple[np.ndarray, np.ndarray]:
+		"""
+		Computes the data bus geometry without touching the plot.
+
+		Returns:
+			Tuple[np.ndarray, np.ndarray]: The data bus segments, one per row of chips, and the (x, y) point
+			where each chip connects to its data bus.
+		"""
+		bus_y = self._row_y - self.CHIP_SPACING / 10
+		X, Y = np.meshgrid(self._col_x + self.DATABUS_OFFSET, self._row_y)
+		segments = self.make_segments((0, bus_y, self.columns * self.CHIP_SPACING, bus_y))
+		return (segments, np.column_stack([X.ravel(), Y.ravel()]))
+
+
 	def draw_data_lines(self) -> None:
 		"""
 		Draws the data lines connecting the chips to the data bus.
 		"""
-		self.axis.arrow(self.columns * self.CHIP_SPACING, -1, dx = 0, dy = self.rows * self.CHIP_SPACING, head_width = 0.1, head_length = 0.1, color = 'black')
-		self.axis.arrow(self.columns * self.CHIP_SPACING, self.rows * self.CHIP_SPACING - 1, dx=0, dy= - self.rows * self.CHIP_SPACING, head_width=0.1, head_length=0.1, color='black')
-		for row in range(self.rows):
-			self.axis.plot([0, self.columns * self.CHIP_SPACING], [row * self.CHIP_SPACING - (self.CHIP_SPACING / 10), row * self.CHIP_SPACING - (self.CHIP_SPACING / 10)], color = 'black', lw = 1.5)
-			for col in range(self.columns):
-				self.axis.arrow(col * self.CHIP_SPACING + self.DATABUS_OFFSET, row * self.CHIP_SPACING - (self.CHIP_SPACING / 10), dx = 0, dy = self.CHIP_SPACING / 15, head_width = 0.1, head_length = 0.1, color = 'black', lw = 1.5)
-				self.axis.arrow(col * self.CHIP_SPACING + self.DATABUS_OFFSET, row * self.CHIP_SPACING, dx = 0, dy = self.CHIP_SPACING / 15 * -1, head_width = 0.1, head_length = 0.1, color='black', lw = 1.5)
+		bus_offset = self.CHIP_SPACING / 10
+		arrow_length = self.CHIP_SPACING / 15
+		segments, connections = self.build_data_lines_segments()
+		self.add_lines(segments)
+		bus_arrows = [
+			patches.FancyArrow(self.columns * self.CHIP_SPACING, -1, dx = 0, dy = self.rows * self.CHIP_SPACING, head_width = 0.1, head_length = 0.1, color = 'black'),
+			patches.FancyArrow(self.columns * self.CHIP_SPACING, self.rows * self.CHIP_SPACING - 1, dx = 0, dy = - self.rows * self.CHIP_SPACING, head_width = 0.1, head_length = 0.1, color = 'black'),
+		]
+		self.axis.add_collection(collections.PatchCollection(bus_arrows, match_original = True), autolim = False)
+		# Every chip has one arrow up from its data bus and one down from the chip, alternating through the offsets
+		up = patches.FancyArrow(0, 0, dx = 0, dy = arrow_length, head_width = 0.1, head_length = 0.1).get_path()
+		down = patches.FancyArrow(0, 0, dx = 0, dy = -arrow_length, head_width = 0.1, head_length = 0.1).get_path()
+		offsets = np.stack([connections - (0, bus_offset), connections], axis = 1).reshape(-1, 2)
+		self.add_shapes([up, down], offsets, color = 'black', linewidth = 1.5)
+
+
+def build_figure(
+	memory_capacity: int,
+	memory_wordsize: int,
+	chip_capacity: int,
+	chip_wordsize: int,
+	axis: Optional[ax.Axes] = None,
+) -> fig.Figure:
+	"""
+	Builds the complete memory layout figure for the given parameters.
+
+	Args:
+		memory_capacity (int): The total capacity of the memory system (in bytes).
+		memory_wordsize (int): The word size of the memory (in bytes).
+		chip_capacity (int): The capacity of a single chip (in bytes).
+		chip_wordsize (int): The word size of a single chip (in bytes).
+		axis (Optional[ax.Axes]): An existing axis to draw the layout on, replacing its contents.
+
+	Returns:
+		fig.Figure: The figure containing the drawn memory layout.
+	"""
+	memory = Memory(
+		memory_capacity=memory_capacity,
+		memory_wordsize=memory_wordsize,
+		chip_capacity=chip_capacity,
+		chip_wordsize=chip_wordsize,
+		axis=axis
+	)
+	memory.draw_chips()
+	memory.draw_addressing_unit()
+	memory.draw_RW()
+	memory.draw_decoder()
+	memory.draw_address_lines()
+	memory.draw_data_lines()
+	return memory.figure
 
 
 class MemoryApp:
@@ -259,9 +548,12 @@ class MemoryApp:
     ----------
     __init__(self, window): Initializes the MemoryApp with a Tkinter window.
     create_menu(self): Creates the menu bar with options to start a new layout or exit the application.
+    create_figure(self): Creates the figure the layouts are drawn on, importing Matplotlib on first use.
     create_input_frame(self): Creates the input frame where the user enters memory and chip details.
     generate_layout(self): Processes the user input to generate the memory layout and visualize it.
-    show_layout(self, figure): Displays the generated memory layout figure in the window.
+    show_layout(self): Displays the app's memory layout figure in the window.
+    schedule_render(self, event): Schedules a render of the layout once the window stops resizing.
+    render_layout(self): Renders the layout figure into a static image sized to the window.
     show_input_frame(self): Resets the window to show the input frame again.
     """
 
@@ -282,6 +574,14 @@ class MemoryApp:
 		screen_height = window.winfo_screenheight()
 		self.window.geometry(f"{screen_width}x{screen_height}")
 		self.create_menu()
+		self.figure = None
+		self.axis = None
+		self.layout_parameters = None
+		self.layout_frame = None
+		self.layout_label = None
+		self.layout_image = None
+		self.rendered_size = None
+		self.render_job = None
 		self.canvas = None
 		self.create_input_frame()
 
@@ -296,6 +596,17 @@ class MemoryApp:
 		self.window.config(menu = menu_bar)
 
 
+	def create_figure(self):
+		"""
+        Creates the figure every layout is drawn on. It is created once, when the first layout is generated,
+        and reused for each new layout.
+        """
+		load_matplotlib()
+		self.figure = fig.Figure(figsize = (15, 15))
+		self.figure.subplots_adjust(left = 0, right = 1, bottom = 0, top = 1)
+		self.axis = self.figure.add_subplot()
+
+
 	def create_input_frame(self):
 		"""
         Creates the frame where the user can input memory and chip parameters for generating the layout.
@@ -326,62 +637,100 @@ class MemoryApp:
 	def generate_layout(self):
 		"""
         Generates the memory layout based on the user inputs, and displays the generated layout in the window.
-        The method creates a Memory object using the input parameters and calls methods to draw various
-        components of the memory layout. If any error occurs (e.g., invalid input), an error message is shown.
+        The layout is drawn on the app's figure, and is only redrawn when the parameters differ from the
+        layout already on it. If any error occurs (e.g., invalid input), an error message is shown.
         """
 		try:
 			memory_capacity = int(self.memory_capacity_entry.get())
 			memory_wordsize = int(self.memory_wordsize_entry.get())
 			chip_capacity = int(self.chip_capacity_entry.get())
 			chip_wordsize = int(self.chip_wordsize_entry.get())
-			memory = Memory(
-				memory_capacity=memory_capacity,
-				memory_wordsize=memory_wordsize,
-				chip_capacity=chip_capacity,
-				chip_wordsize=chip_wordsize
-			)
-			memory.draw_chips()
-			memory.draw_addressing_unit()
-			memory.draw_RW()
-			memory.draw_decoder()
-			memory.draw_address_lines()
-			memory.draw_data_lines()
+			parameters = (memory_capacity, memory_wordsize, chip_capacity, chip_wordsize)
+			# Reject invalid parameters before Matplotlib is imported or the figure is created
+			Memory.calculate_dimensions(*parameters)
+			if self.figure is None:
+				self.create_figure()
+			if parameters != self.layout_parameters:
+				self.layout_parameters = None
+				build_figure(
+					memory_capacity=memory_capacity,
+					memory_wordsize=memory_wordsize,
+					chip_capacity=chip_capacity,
+					chip_wordsize=chip_wordsize,
+					axis=self.axis
+				)
+				self.layout_parameters = parameters
 			self.input_frame.destroy()
-			self.show_layout(memory.figure)
+			self.show_layout()
 		except ValueError as e:
 			messagebox.showerror("Input Error", str(e))
 		except Exception as e:
 			messagebox.showerror("Error", f"An error occurred: {e}")
 
 
-	def show_layout(self, figure):
+	def show_layout(self):
 		"""
-        Displays the generated memory layout figure in the application window.
-        
+        Displays the app's memory layout figure in the application window.
+        The layout frame and the canvas on the figure are created on the first call and reused afterwards.
+        """
+		if self.canvas is None:
+			self.layout_frame = tk.Frame(self.window)
+			self.layout_frame.grid(row = 0, column = 0, sticky = "nsew")
+			self.layout_label = tk.Label(self.layout_frame, borderwidth = 0, highlightthickness = 0, padx = 0, pady = 0)
+			self.layout_label.pack(fill = "both", expand = True)
+			self.layout_label.bind("<Configure>", self.schedule_render)
+			self.canvas = FigureCanvasAgg(self.figure)
+		else:
+			self.layout_frame.grid()
+		self.window.columnconfigure(0, weight = 1)
+		self.window.rowconfigure(0, weight = 1)
+		self.rendered_size = None
+		self.render_layout()
+
+
+	def schedule_render(self, event = None):
+		"""
+        Schedules the layout to be rendered shortly after the layout label is resized.
+        Any render still pending is cancelled, so dragging the window edge renders the figure only once it settles.
+
         Parameters:
         -----------
-        figure : matplotlib.figure.Figure
-            The figure object containing the visualized memory layout.
+        event : tkinter.Event, optional
+            The <Configure> event that triggered the render, if any.
         """
-		if self.canvas:
-			self.canvas.get_tk_widget().destroy()
-		layout_frame = tk.Frame(self.window)
-		layout_frame.grid(row = 0, column = 0, sticky = "nsew")
-		figure.set_size_inches(self.window.winfo_width() / 50, self.window.winfo_height() / 50)
-		self.canvas = FigureCanvasTkAgg(figure, master = layout_frame)
-		self.canvas.get_tk_widget().pack(fill = "both", expand = True)
+		if self.render_job is not None:
+			self.window.after_cancel(self.render_job)
+		self.render_job = self.window.after(100, self.render_layout)
+
+
+	def render_layout(self):
+		"""
+        Renders the layout figure once into an image sized to the layout label and displays it.
+        Tk repaints the static image on its own, so the figure is only rendered again when the label is resized.
+        """
+		self.render_job = None
+		width = self.layout_label.winfo_width()
+		height = self.layout_label.winfo_height()
+		# Before the label is mapped its size is 1x1; the <Configure> binding renders it once it has a real size
+		if width <= 1 or height <= 1 or (width, height) == self.rendered_size:
+			return
+		figure = self.figure
+		figure.set_size_inches(width / figure.dpi, height / figure.dpi)
 		self.canvas.draw()
-		self.window.columnconfigure(0, weight = 1)
-		self.window.rowconfigure(0, weight = 1)
+		image = Image.fromarray(np.asarray(self.canvas.buffer_rgba()))
+		self.layout_image = ImageTk.PhotoImage(image)
+		self.layout_label.configure(image = self.layout_image)
+		self.rendered_size = (width, height)
 
 
 	def show_input_frame(self):
 		"""
         Resets the window to show the input frame for entering memory and chip parameters again.
+        The layout frame is only hidden, so its label, canvas and figure are reused by the next layout.
         """
-		for widget in self.window.winfo_children():
-			widget.destroy()
-		self.create_menu()
+		if self.layout_frame is not None:
+			self.layout_frame.grid_remove()
+		self.input_frame.destroy()
 		self.create_input_frame()
 
 